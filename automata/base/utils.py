@@ -12,7 +12,10 @@ def freeze_value(value):
     immutable one by recursively processing said structure and any of its
     members, freezing them as well
     """
-    if isinstance(value, (str, int)):
+    # Most values are plain strings or integers (such as state names and
+    # input symbols), so compare their exact type first; subclasses of either
+    # fall through the checks below and are returned unchanged anyway
+    if type(value) in (str, int):
         return value
     if isinstance(value, dict):
         return frozendict({
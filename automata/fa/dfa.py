@@ -6,7 +6,6 @@
 from random import Random
 
 import networkx as nx
-from pydot import Dot, Edge, Node
 
 import automata.base.exceptions as exceptions
 import automata.fa.fa as fa
@@ -834,15 +833,14 @@ def minimum_word_length(self):
         Returns the length of the shortest word in the language represented by the DFA
         """
         queue = deque()
-        distances = defaultdict(lambda: None)
-        distances[self.initial_state] = 0
+        distances = {self.initial_state: 0}
         queue.append(self.initial_state)
         while queue:
             state = queue.popleft()
             if state in self.final_states:
                 return distances[state]
             for next_state in self.transitions[state].values():
-                if distances[next_state] is None:
+                if next_state not in distances:
                     distances[next_state] = distances[state] + 1
                     queue.append(next_state)
         raise exceptions.EmptyLanguageException('The language represented by the DFA is empty')
@@ -1283,39 +1281,43 @@ def show_diagram(self, path=None):
         """
             Creates the graph associated with this DFA
         """
+        # pydot is only needed for drawing, so defer importing it until a
+        # diagram is requested
+        from pydot import Dot, Edge, Node
+
         # Nodes are set of states
 
         graph = Dot(graph_type='digraph', rankdir='LR')
-        nodes = {}
-        for state in self.states:
-            if state == self.initial_state:
+        # Map each state to its node name once so that edges do not need to
+        # re-derive it from the node on every transition
+        node_names = {}
+        add_node = graph.add_node
+        initial_state = self.initial_state
+        final_states = self.final_states
+        states = tuple(self.states)
+        for state, state_name in zip(states, self._get_state_names(states)):
+            node_attrs = {}
+            if state == initial_state:
                 # color start state with green
-                if state in self.final_states:
-                    initial_state_node = Node(
-                        state,
-                        style='filled',
-                        peripheries=2,
-                        fillcolor='#66cc33')
-                else:
-                    initial_state_node = Node(
-                        state, style='filled', fillcolor='#66cc33')
-                nodes[state] = initial_state_node
-                graph.add_node(initial_state_node)
-            else:
-                if state in self.final_states:
-                    state_node = Node(state, peripheries=2)
-                else:
-                    state_node = Node(state)
-                nodes[state] = state_node
-                graph.add_node(state_node)
-        # adding edges
+                node_attrs.update(style='filled', fillcolor='#66cc33')
+            if state in final_states:
+                node_attrs['peripheries'] = 2
+            state_node = Node(state_name, **node_attrs)
+            node_names[state] = str(state_node.get_name())
+            add_node(state_node)
+        # adding edges, merging the symbols of parallel transitions into a
+        # single edge per pair of states
+        edge_labels = defaultdict(set)
         for from_state, lookup in self.transitions.items():
             for to_label, to_state in lookup.items():
-                graph.add_edge(Edge(
-                    nodes[from_state],
-                    nodes[to_state],
-                    label=to_label
-                ))
+                edge_labels[from_state, to_state].add(str(to_label))
+        add_edge = graph.add_edge
+        for (from_state, to_state), labels in edge_labels.items():
+            add_edge(Edge(
+                node_names[from_state],
+                node_names[to_state],
+                label=self._get_edge_label(labels)
+            ))
         if path:
             graph.write_png(path)
         return graph
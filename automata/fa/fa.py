@@ -9,4 +9,75 @@
 class FA(Automaton, metaclass=abc.ABCMeta):
     """An abstract base class for finite automata."""
 
-    pass
+    @staticmethod
+    def get_state_name(state):
+        """
+        Return a readable name for the given state, as used to label it in
+        diagrams. Sets are written as {...} with their members sorted, tuples
+        and lists as (...), the empty set as ∅ and the empty string as λ.
+        """
+        return FA._get_state_names((state,))[0]
+
+    @staticmethod
+    def _get_state_names(states):
+        """
+        Return the names of the given states (see get_state_name()), in order.
+        Names of frozensets are memoized for the duration of the call, so a
+        set shared between states (common in subset constructions) is only
+        named once.
+
+        The returned names are unique, since they are used as diagram node
+        names. Distinct states that would share a name (such as '' and 'λ',
+        or 3 and '3') are told apart by appending primes (') to the later
+        ones.
+        """
+        names_by_member = {}
+        state_names = []
+        seen_state_names = set()
+        for state in states:
+            # States produced by subset or product constructions can be nested
+            # arbitrarily deep, so walk them with an explicit stack (in
+            # post-order) rather than recursing; each finished member name is
+            # pushed onto member_names until its enclosing collection is closed
+            member_names = []
+            stack = [(state, False)]
+            while stack:
+                value, is_expanded = stack.pop()
+                if isinstance(value, str):
+                    member_names.append(value if value else 'λ')
+                elif isinstance(value, frozenset) and value in names_by_member:
+                    member_names.append(names_by_member[value])
+                elif isinstance(value, (frozenset, set, tuple, list)):
+                    if not is_expanded:
+                        stack.append((value, True))
+                        stack.extend((member, False) for member in reversed(tuple(value)))
+                        continue
+                    first_member_index = len(member_names) - len(value)
+                    members = member_names[first_member_index:]
+                    del member_names[first_member_index:]
+                    if isinstance(value, (frozenset, set)):
+                        name = '{' + ','.join(sorted(members)) + '}' if members else '∅'
+                    else:
+                        name = '(' + ','.join(members) + ')'
+                    if isinstance(value, frozenset):
+                        names_by_member[value] = name
+                    member_names.append(name)
+                else:
+                    member_names.append(str(value))
+            state_name = member_names[0]
+            while state_name in seen_state_names:
+                state_name += "'"
+            seen_state_names.add(state_name)
+            state_names.append(state_name)
+        return state_names
+
+    @staticmethod
+    def _get_edge_label(symbols):
+        """
+        Return the quoted DOT label for a diagram edge taken on the given
+        symbols. The label is quoted so that Graphviz does not read the commas
+        between merged symbols as attribute separators, which means any
+        backslashes and quotes within the symbols must be escaped here.
+        """
+        label = ','.join(sorted(symbols))
+        return '"{}"'.format(label.replace('\\', '\\\\').replace('"', '\\"'))
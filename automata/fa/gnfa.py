@@ -4,7 +4,6 @@
 from itertools import product
 
 from frozendict import frozendict
-from pydot import Dot, Edge, Node
 
 import automata.base.exceptions as exceptions
 import automata.fa.fa as fa
@@ -60,7 +59,7 @@ def from_dfa(cls, dfa):
                 new_gnfa_transitions[state] = dict()
 
         new_initial_state = GNFA._add_new_state(gnfa_states)
-        new_final_state = GNFA._add_new_state(gnfa_states, new_initial_state)
+        new_final_state = GNFA._add_new_state(gnfa_states, new_initial_state + 1)
 
         new_gnfa_transitions[new_initial_state] = {dfa.initial_state: ''}
 
@@ -106,7 +105,7 @@ def from_nfa(cls, nfa):
                 new_gnfa_transitions[state] = dict()
 
         new_initial_state = GNFA._add_new_state(gnfa_states)
-        new_final_state = GNFA._add_new_state(gnfa_states, new_initial_state)
+        new_final_state = GNFA._add_new_state(gnfa_states, new_initial_state + 1)
 
         new_gnfa_transitions[new_initial_state] = {nfa.initial_state: ''}
 
@@ -272,40 +271,44 @@ def show_diagram(self, path=None, show_None=True):
         """
             Creates the graph associated with this DFA
         """
+        # pydot is only needed for drawing, so defer importing it until a
+        # diagram is requested
+        from pydot import Dot, Edge, Node
+
         # Nodes are set of states
 
         graph = Dot(graph_type='digraph', rankdir='LR')
-        nodes = {}
-        for state in self.states:
-            if state == self.initial_state:
+        # Map each state to its node name once so that edges do not need to
+        # re-derive it from the node on every transition
+        node_names = {}
+        add_node = graph.add_node
+        initial_state = self.initial_state
+        final_state = self.final_state
+        states = tuple(self.states)
+        for state, state_name in zip(states, self._get_state_names(states)):
+            node_attrs = {}
+            if state == initial_state:
                 # color start state with green
-                initial_state_node = Node(
-                    state, style='filled', fillcolor='#66cc33')
-                nodes[state] = initial_state_node
-                graph.add_node(initial_state_node)
-            else:
-                if state == self.final_state:
-                    state_node = Node(state, peripheries=2)
-                else:
-                    state_node = Node(state)
-                nodes[state] = state_node
-                graph.add_node(state_node)
+                node_attrs.update(style='filled', fillcolor='#66cc33')
+            elif state == final_state:
+                node_attrs['peripheries'] = 2
+            state_node = Node(state_name, **node_attrs)
+            node_names[state] = str(state_node.get_name())
+            add_node(state_node)
         # adding edges
+        add_edge = graph.add_edge
         for from_state, lookup in self.transitions.items():
+            from_node_name = node_names[from_state]
             for to_state, to_label in lookup.items():  # pragma: no branch
-                if to_label is None and show_None:
+                if to_label is None:
+                    if not show_None:
+                        continue
                     to_label = "ø"
-                    graph.add_edge(Edge(
-                        nodes[from_state],
-                        nodes[to_state],
-                        label=to_label
-                    ))
-                elif to_label is not None:
-                    graph.add_edge(Edge(
-                        nodes[from_state],
-                        nodes[to_state],
-                        label=to_label
-                    ))
+                add_edge(Edge(
+                    from_node_name,
+                    node_names[to_state],
+                    label=to_label
+                ))
         if path:
             graph.write_png(path)
         return graph
@@ -1,11 +1,10 @@
 #!/usr/bin/env python3
 """Classes and methods for working with nondeterministic finite automata."""
-from collections import deque
+from collections import defaultdict, deque
 from itertools import chain, count, product
 
 import networkx as nx
 from frozendict import frozendict
-from pydot import Dot, Edge, Node
 
 import automata.base.exceptions as exceptions
 import automata.fa.fa as fa
@@ -675,40 +674,46 @@ def show_diagram(self, path=None):
         """
             Creates the graph associated with this DFA
         """
+        # pydot is only needed for drawing, so defer importing it until a
+        # diagram is requested
+        from pydot import Dot, Edge, Node
+
         # Nodes are set of states
 
         graph = Dot(graph_type='digraph', rankdir='LR')
-        nodes = {}
-        for state in self.states:
-            if state == self.initial_state:
+        # Map each state to its node name once so that edges do not need to
+        # re-derive it from the node on every transition
+        node_names = {}
+        add_node = graph.add_node
+        initial_state = self.initial_state
+        final_states = self.final_states
+        states = tuple(self.states)
+        for state, state_name in zip(states, self._get_state_names(states)):
+            node_attrs = {}
+            if state == initial_state:
                 # color start state with green
-                if state in self.final_states:
-                    initial_state_node = Node(
-                        state,
-                        style='filled',
-                        peripheries=2,
-                        fillcolor='#66cc33')
-                else:
-                    initial_state_node = Node(
-                        state, style='filled', fillcolor='#66cc33')
-                nodes[state] = initial_state_node
-                graph.add_node(initial_state_node)
-            else:
-                if state in self.final_states:
-                    state_node = Node(state, peripheries=2)
-                else:
-                    state_node = Node(state)
-                nodes[state] = state_node
-                graph.add_node(state_node)
-        # adding edges
+                node_attrs.update(style='filled', fillcolor='#66cc33')
+            if state in final_states:
+                node_attrs['peripheries'] = 2
+            state_node = Node(state_name, **node_attrs)
+            node_names[state] = str(state_node.get_name())
+            add_node(state_node)
+        # adding edges, merging the symbols of parallel transitions into a
+        # single edge per pair of states; epsilon is drawn as λ so that it
+        # stays visible once merged with other symbols
+        edge_labels = defaultdict(set)
         for from_state, lookup in self.transitions.items():
             for to_label, to_states in lookup.items():
                 for to_state in to_states:
-                    graph.add_edge(Edge(
-                        nodes[from_state],
-                        nodes[to_state],
-                        label=to_label
-                    ))
+                    edge_labels[from_state, to_state].add(
+                        'λ' if to_label == '' else str(to_label))
+        add_edge = graph.add_edge
+        for (from_state, to_state), labels in edge_labels.items():
+            add_edge(Edge(
+                node_names[from_state],
+                node_names[to_state],
+                label=self._get_edge_label(labels)
+            ))
         if path:
             graph.write_png(path)
         return graph
@@ -730,7 +735,12 @@ def _load_new_transition_dict(state_map_dict,
 
     @staticmethod
     def _add_new_state(state_set, start=0):
-        """Adds new state to the state set and returns it"""
+        """
+        Adds new state to the state set and returns it. The new state is the
+        smallest integer not less than start that is not already in the set,
+        so callers adding several states in a row should pass one more than
+        the previously added state to avoid re-scanning the taken integers.
+        """
         new_state = start
         while new_state in state_set:
             new_state += 1
@@ -43,16 +43,10 @@ def __repr__(self):
 
     def print(self):
         """Print the machine's current configuration in a readable form."""
-        description = '{}: \n'.format(self.state)
+        description = f'{self.state}: \n'
         for i, tape in enumerate(self.tapes):
-            title = '> Tape {}: '.format(i+1)
-            position = tape.current_position + len(title) + 1
-            description += '> Tape {j}: {tape}\n{current_position}\n'.format(
-                j=i+1,
-                tape=''.join(tape).ljust(
-                    tape.current_position, '#'),
-                current_position='^'.rjust(
-                    position
-                ),
-            )
+            title = f'> Tape {i+1}: '
+            tape_symbols = ''.join(tape).ljust(tape.current_position, '#')
+            current_position = '^'.rjust(tape.current_position + len(title) + 1)
+            description += f'{title}{tape_symbols}\n{current_position}\n'
         print(description)
@@ -1246,12 +1246,12 @@ def test_show_diagram_initial_final_different(self):
             {(edge.get_source(), edge.get_label(), edge.get_destination())
              for edge in graph.get_edges()},
             {
-                ('q0', '0', 'q0'),
-                ('q0', '1', 'q1'),
-                ('q1', '0', 'q0'),
-                ('q1', '1', 'q2'),
-                ('q2', '0', 'q2'),
-                ('q2', '1', 'q1')
+                ('q0', '"0"', 'q0'),
+                ('q0', '"1"', 'q1'),
+                ('q1', '"0"', 'q0'),
+                ('q1', '"1"', 'q2'),
+                ('q2', '"0"', 'q2'),
+                ('q2', '"1"', 'q1')
             })
 
     def test_show_diagram_initial_final_same(self):
@@ -1284,12 +1284,61 @@ def test_show_diagram_initial_final_same(self):
             {(edge.get_source(), edge.get_label(), edge.get_destination())
              for edge in graph.get_edges()},
             {
-                ('q0', '0', 'q0'),
-                ('q0', '1', 'q1'),
-                ('q1', '0', 'q0'),
-                ('q1', '1', 'q2'),
-                ('q2', '0', 'q2'),
-                ('q2', '1', 'q2')
+                ('q0', '"0"', 'q0'),
+                ('q0', '"1"', 'q1'),
+                ('q1', '"0"', 'q0'),
+                ('q1', '"1"', 'q2'),
+                ('q2', '"0,1"', 'q2')
+            })
+        # The merged label must stay quoted in the DOT source, or Graphviz
+        # would read its comma as an attribute separator
+        self.assertIn('label="0,1"', graph.to_string())
+
+    def test_show_diagram_escaped_labels(self):
+        """
+        Should escape quotes and backslashes in the edge labels of a DFA.
+        """
+        dfa = DFA(
+            states={'q0', 'q1'},
+            input_symbols={'"', '\\'},
+            transitions={
+                'q0': {'"': 'q1', '\\': 'q0'},
+                'q1': {'"': 'q1', '\\': 'q1'}
+            },
+            initial_state='q0',
+            final_states={'q1'}
+        )
+        graph_source = dfa.show_diagram().to_string()
+        self.assertIn(r'label="\""', graph_source)
+        self.assertIn(r'label="\\"', graph_source)
+        self.assertIn(r'label="\",\\"', graph_source)
+
+    def test_show_diagram_composite_states(self):
+        """
+        Should name the nodes of a DFA whose states are sets of states.
+        """
+        nfa = NFA(
+            states={'q0', 'q1'},
+            input_symbols={'a'},
+            transitions={
+                'q0': {'a': {'q0', 'q1'}},
+                'q1': {}
+            },
+            initial_state='q0',
+            final_states={'q1'}
+        )
+        graph = DFA.from_nfa(nfa, retain_names=True).show_diagram()
+        # Older pydot versions quote these names, so compare them unquoted
+        self.assertEqual(
+            {node.get_name().strip('"') for node in graph.get_nodes()},
+            {'{{q0}}', '{{q0,q1}}'})
+        self.assertEqual(
+            {(edge.get_source().strip('"'), edge.get_label(),
+              edge.get_destination().strip('"'))
+             for edge in graph.get_edges()},
+            {
+                ('{{q0}}', '"a"', '{{q0,q1}}'),
+                ('{{q0,q1}}', '"a"', '{{q0,q1}}')
             })
 
     def test_show_diagram_write_file(self):
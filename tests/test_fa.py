@@ -4,6 +4,7 @@
 import unittest
 
 from automata.fa.dfa import DFA
+from automata.fa.fa import FA
 from automata.fa.gnfa import GNFA
 from automata.fa.nfa import NFA
 
@@ -52,3 +53,38 @@ def setUp(self):
             initial_state='q_in',
             final_state='q_f'
         )
+
+
+class TestFAStateNames(unittest.TestCase):
+    """A test class for naming finite automaton states."""
+
+    def test_get_state_name(self):
+        """Should name plain states as strings."""
+        self.assertEqual(DFA.get_state_name('q0'), 'q0')
+        self.assertEqual(DFA.get_state_name(''), 'λ')
+        self.assertEqual(DFA.get_state_name(3), '3')
+
+    def test_get_state_name_nested(self):
+        """Should name nested collections of states."""
+        self.assertEqual(
+            NFA.get_state_name(frozenset({frozenset({'q1', 'q0'}), frozenset()})),
+            '{{q0,q1},∅}')
+        self.assertEqual(
+            GNFA.get_state_name((frozenset({2, 1}), ('a', ''), [0])),
+            '({1,2},(a,λ),(0))')
+
+    def test_get_state_name_shared_members(self):
+        """Should name sets shared between states consistently."""
+        shared_state = frozenset({'q0', 'q1'})
+        self.assertEqual(
+            FA._get_state_names([
+                frozenset({shared_state}),
+                (shared_state, 'q2'),
+                shared_state
+            ]),
+            ['{{q0,q1}}', '({q0,q1},q2)', '{q0,q1}'])
+
+    def test_get_state_names_unique(self):
+        """Should give distinct states that share a name distinct names."""
+        self.assertEqual(FA._get_state_names(['', 'λ']), ['λ', "λ'"])
+        self.assertEqual(FA._get_state_names([3, '3']), ['3', "3'"])
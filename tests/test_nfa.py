@@ -606,10 +606,60 @@ def test_show_diagram_initial_final_same(self):
             {(edge.get_source(), edge.get_label(), edge.get_destination())
              for edge in graph.get_edges()},
             {
-                ('q0', 'a', 'q1'),
-                ('q1', 'a', 'q1'),
-                ('q1', '', 'q2'),
-                ('q2', 'b', 'q0')
+                ('q0', '"a"', 'q1'),
+                ('q1', '"a"', 'q1'),
+                ('q1', '"λ"', 'q2'),
+                ('q2', '"b"', 'q0')
+            })
+
+    def test_show_diagram_parallel_transitions(self):
+        """
+        Should merge the symbols of parallel transitions into a single edge.
+        """
+
+        nfa = NFA(
+            states={'q0', 'q1'},
+            input_symbols={'a', 'b'},
+            transitions={
+                'q0': {'b': {'q0', 'q1'}, 'a': {'q1'}},
+                'q1': {'': {'q0'}, 'a': {'q0'}}
+            },
+            initial_state='q0',
+            final_states={'q1'}
+        )
+        graph = nfa.show_diagram()
+        self.assertEqual(
+            {(edge.get_source(), edge.get_label(), edge.get_destination())
+             for edge in graph.get_edges()},
+            {
+                ('q0', '"b"', 'q0'),
+                ('q0', '"a,b"', 'q1'),
+                ('q1', '"a,λ"', 'q0')
+            })
+        self.assertIn('label="a,b"', graph.to_string())
+
+    def test_show_diagram_falsy_symbol(self):
+        """
+        Should only draw the empty string symbol as epsilon.
+        """
+
+        nfa = NFA(
+            states={'q0', 'q1'},
+            input_symbols={0, 1},
+            transitions={
+                'q0': {0: {'q1'}, 1: {'q0'}},
+                'q1': {}
+            },
+            initial_state='q0',
+            final_states={'q1'}
+        )
+        graph = nfa.show_diagram()
+        self.assertEqual(
+            {(edge.get_source(), edge.get_label(), edge.get_destination())
+             for edge in graph.get_edges()},
+            {
+                ('q0', '"1"', 'q0'),
+                ('q0', '"0"', 'q1')
             })
 
     def test_show_diagram_write_file(self):
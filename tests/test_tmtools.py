@@ -57,6 +57,16 @@ def test_print_config(self):
         self.assertEqual(out.getvalue().rstrip(), '{}: {}\n{}'.format(
             'q2', 'abcdefghij', '^'.rjust(7)))
 
+    def test_print_multitape_config(self):
+        """Should print the given multitape configuration to stdout."""
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            self.config2.print()
+        self.assertEqual(out.getvalue().rstrip(), '{}: \n{}\n{}\n{}\n{}'.format(
+            'q1',
+            '> Tape 1: abcdefghij', '^'.rjust(13),
+            '> Tape 2: klmnopq', '^'.rjust(16)))
+
     @patch('automata.tm.configuration.TMConfiguration.print')
     def test_print_configs(self, print_config):
         """Should print each machine configuration to stdout."""